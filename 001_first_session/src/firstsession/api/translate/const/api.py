@@ -1,5 +1,5 @@
 # 목적: API 경로 접두어와 태그 상수를 정의한다.
-# 설명: 전역 prefix와 translate 경로를 한 곳에서 관리한다.
+# 설명: 전역 prefix와 translate/batch 경로를 한 곳에서 관리한다.
 # 디자인 패턴: 상수 모듈 패턴
 # 참조: firstsession/api/translate/router/translate_router.py
 
@@ -7,4 +7,9 @@
 
 API_V1_PREFIX = "/api/v1"
 TRANSLATE_PREFIX = "/translate"
+TRANSLATE_BATCH_PATH = "/batch"
 TRANSLATE_TAG = "translate"
+
+# 배치 요청 한 번에 받을 수 있는 최대 번역 건수
+# (한 요청이 그래프 실행과 상태/결과를 무제한으로 쌓지 않도록 제한한다)
+TRANSLATE_BATCH_MAX_SIZE = 64
@@ -5,10 +5,12 @@
 
 """번역 API 라우터 모듈."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Body
 
 from firstsession.api.translate.const.api import (
     API_V1_PREFIX,
+    TRANSLATE_BATCH_MAX_SIZE,
+    TRANSLATE_BATCH_PATH,
     TRANSLATE_PREFIX,
     TRANSLATE_TAG,
 )
@@ -38,9 +40,15 @@ class TranslateRouter:
             methods=["POST"],
             response_model=TranslationResponse,
         )
+        self.router.add_api_route(
+            path=TRANSLATE_BATCH_PATH,
+            endpoint=self.translate_batch,
+            methods=["POST"],
+            response_model=list[TranslationResponse],
+        )
 
 
-    def translate(self, request: TranslationRequest) -> TranslationResponse:
+    async def translate(self, request: TranslationRequest) -> TranslationResponse:
         """번역 요청을 처리한다.
 
         Args:
@@ -49,5 +57,23 @@ class TranslateRouter:
         Returns:
             TranslationResponse: 번역 결과.
         """
-        return self.service.translate(request)
+        return await self.service.translate(request)
+
+    async def translate_batch(
+        self,
+        requests: list[TranslationRequest] = Body(
+            ..., max_length=TRANSLATE_BATCH_MAX_SIZE
+        ),
+    ) -> list[TranslationResponse]:
+        """여러 번역 요청을 한 번에 처리한다.
+
+        요청 건수가 TRANSLATE_BATCH_MAX_SIZE를 넘으면 FastAPI가 422로 거절한다.
+
+        Args:
+            requests: 번역 요청 데이터 목록.
+
+        Returns:
+            list[TranslationResponse]: 요청 순서와 동일한 번역 결과 목록.
+        """
+        return await self.service.translate_many(requests)
 
@@ -5,48 +5,91 @@
 
 """번역 서비스 모듈."""
 
+import logging
+
 from firstsession.api.translate.model.translation_request import TranslationRequest
 from firstsession.api.translate.model.translation_response import TranslationResponse
 from firstsession.core.translate.graphs.translate_graph import TranslateGraph
 from firstsession.core.translate.state.translation_state import TranslationState
 
+logger = logging.getLogger(__name__)
+
+
 class TranslationService:
     """번역 요청을 처리하는 서비스."""
 
-    def __init__(self, graph: TranslateGraph) -> None:
+    def __init__(self, graph: TranslateGraph, max_retry_count: int = 1) -> None:
         """서비스 의존성을 초기화한다.
 
         Args:
             graph: 번역 그래프 실행기.
+            max_retry_count: QC 실패 시 최대 재시도 횟수(1 미만이면 1로 보정).
         """
         self.graph = graph
+        # 재시도 설정은 여기서 한 번만 int로 보정한다.
+        # (그래프 노드/라우터는 state["retry_count"]를 그대로 믿고 쓴다)
+        self._max_retry_count = max(int(max_retry_count), 1)
+
+    def _build_state(self, request: TranslationRequest) -> TranslationState:
+        """요청 모델로 그래프 초기 상태를 만든다.
+
+        Args:
+            request: 번역 요청 모델.
 
-    def translate(self, request: TranslationRequest) -> TranslationResponse:
-        state = {
+        Returns:
+            TranslationState: 재시도 필드가 int로 채워진 초기 상태.
+        """
+        return {
             "source_language": request.source_language,
             "target_language": request.target_language,
             "text": request.text,
             "retry_count": 0,
-            "max_retry_count": 1,
+            "max_retry_count": self._max_retry_count,
         }
 
-        result = self.graph.run(state)
+    async def translate(self, request: TranslationRequest) -> TranslationResponse:
+        state = self._build_state(request)
 
-        if isinstance(result, dict):
-            translated = result.get("translated_text", "")
-            src = result.get("source_language") or request.source_language
-            tgt = result.get("target_language") or request.target_language
-        else:
-            translated = getattr(result, "translated_text", "")
-            src = getattr(result, "source_language", None) or request.source_language
-            tgt = getattr(result, "target_language", None) or request.target_language
-            
-        print("[DBG] service_state_id:", id(state))
+        result = await self.graph.run(state)
 
-        return TranslationResponse(
-            source_language=src,
-            target_language=tgt,
-            translated_text=translated,
-        )
+        logger.debug("[DBG] service_state_id: %s", id(state))
+
+        return self._build_response(request, result)
     
         raise NotImplementedError("번역 서비스 처리 로직을 구현해야 합니다.")
+
+    def _build_response(
+        self, request: TranslationRequest, result: TranslationState
+    ) -> TranslationResponse:
+        """그래프 결과 상태를 응답 모델로 변환한다.
+
+        Args:
+            request: 원래 번역 요청 모델.
+            result: 그래프 실행 결과 상태.
+
+        Returns:
+            TranslationResponse: 번역 응답 모델.
+        """
+        return TranslationResponse(
+            source_language=result.get("source_language") or request.source_language,
+            target_language=result.get("target_language") or request.target_language,
+            translated_text=result.get("translated_text", ""),
+        )
+
+    async def translate_many(
+        self, requests: list[TranslationRequest]
+    ) -> list[TranslationResponse]:
+        """여러 번역 요청을 동시에 처리한다.
+
+        각 요청은 대부분의 시간을 Gemini 응답 대기에 쓰므로,
+        그래프 배치 실행으로 LLM 호출을 겹쳐 실행한다(동시 실행 수는 그래프가 제한).
+
+        Args:
+            requests: 번역 요청 목록.
+
+        Returns:
+            list[TranslationResponse]: 요청 순서와 동일한 번역 결과 목록.
+        """
+        states = [self._build_state(r) for r in requests]
+        results = await self.graph.run_many(states)
+        return [self._build_response(r, res) for r, res in zip(requests, results)]
@@ -0,0 +1,101 @@
+# 목적: LangGraph 노드 캐시용 크기 제한 저장소를 제공한다.
+# 설명: 노드(namespace)별 LRU로 항목 수를 제한하고, 만료 항목은 저장 시점에 정리한다.
+# 디자인 패턴: 어댑터(BaseCache 구현) + LRU
+# 참조: firstsession/core/translate/graphs/translate_graph.py
+
+"""크기 제한 노드 캐시 모듈."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from typing import Any, Optional
+
+from langgraph.cache.base import BaseCache, FullKey, Namespace
+
+
+class BoundedInMemoryCache(BaseCache[Any]):
+    """노드별 최대 항목 수가 있는 인메모리 LRU 캐시.
+
+    LangGraph 기본 InMemoryCache는 크기 제한이 없고, 만료 항목도 같은 키를
+    다시 읽을 때만 지운다. 서로 다른 입력이 계속 들어오는 서버에서는 메모리가
+    줄지 않으므로, 노드마다 LRU 상한을 두고 저장할 때 만료 항목을 함께 정리한다.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """캐시 저장소를 초기화한다.
+
+        Args:
+            maxsize: 노드 하나(namespace)가 보관할 최대 항목 수.
+        """
+        super().__init__()
+        self._maxsize = maxsize
+        # namespace → (key → (enc, data, 만료 시각))
+        self._cache: dict[Namespace, OrderedDict[str, tuple[str, bytes, Optional[float]]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, keys: Sequence[FullKey]) -> dict[FullKey, Any]:
+        """캐시된 값을 조회하고, 적중한 항목을 최근 사용으로 옮긴다."""
+        if not keys:
+            return {}
+        now = time.time()
+        values: dict[FullKey, Any] = {}
+        with self._lock:
+            for ns, key in keys:
+                ns = tuple(ns)
+                entries = self._cache.get(ns)
+                if entries is None or key not in entries:
+                    continue
+                enc, data, expiry = entries[key]
+                if expiry is not None and now >= expiry:
+                    del entries[key]
+                    continue
+                entries.move_to_end(key)
+                values[(ns, key)] = self.serde.loads_typed((enc, data))
+        return values
+
+    async def aget(self, keys: Sequence[FullKey]) -> dict[FullKey, Any]:
+        """캐시된 값을 비동기로 조회한다(메모리 조회라 동기 구현을 그대로 쓴다)."""
+        return self.get(keys)
+
+    def set(self, pairs: Mapping[FullKey, tuple[Any, Optional[int]]]) -> None:
+        """값을 저장하고, 만료 항목과 상한을 넘는 오래된 항목을 지운다."""
+        now = time.time()
+        with self._lock:
+            touched: set[Namespace] = set()
+            for (ns, key), (value, ttl) in pairs.items():
+                ns = tuple(ns)
+                expiry = now + ttl if ttl is not None else None
+                entries = self._cache.setdefault(ns, OrderedDict())
+                entries[key] = (*self.serde.dumps_typed(value), expiry)
+                entries.move_to_end(key)
+                touched.add(ns)
+
+            for ns in touched:
+                entries = self._cache[ns]
+                # 만료 항목 정리: 다시 조회되지 않는 키도 여기서 지워진다.
+                expired = [k for k, (_, _, exp) in entries.items() if exp is not None and now >= exp]
+                for k in expired:
+                    del entries[k]
+                # LRU 상한: 가장 오래 쓰이지 않은 항목부터 버린다.
+                while len(entries) > self._maxsize:
+                    entries.popitem(last=False)
+
+    async def aset(self, pairs: Mapping[FullKey, tuple[Any, Optional[int]]]) -> None:
+        """값을 비동기로 저장한다."""
+        self.set(pairs)
+
+    def clear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        """지정한 namespace(없으면 전체)의 캐시를 비운다."""
+        with self._lock:
+            if namespaces is None:
+                self._cache.clear()
+                return
+            for ns in namespaces:
+                self._cache.pop(tuple(ns), None)
+
+    async def aclear(self, namespaces: Optional[Sequence[Namespace]] = None) -> None:
+        """지정한 namespace(없으면 전체)의 캐시를 비동기로 비운다."""
+        self.clear(namespaces)
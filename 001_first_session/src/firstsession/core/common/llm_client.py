@@ -0,0 +1,32 @@
+# 목적: 번역 노드가 공유하는 Gemini 클라이언트를 제공한다.
+# 설명: 프로세스당 하나의 ChatGoogleGenerativeAI를 만들어 인증/커넥션 풀을 재사용한다.
+# 디자인 패턴: Singleton(모듈 수준 인스턴스)
+# 참조: firstsession/core/translate/nodes (normalize/safeguard/translate/qc_and_fix)
+
+"""공유 LLM 클라이언트 모듈."""
+
+import logging
+
+from langchain_core.messages import HumanMessage
+from langchain_google_genai import ChatGoogleGenerativeAI
+
+logger = logging.getLogger(__name__)
+
+GEMINI_MODEL_ID = "gemini-3-flash-preview"
+
+# 노드마다 클라이언트를 만들면 인증 정보 로드와 HTTP 커넥션 풀이 노드 수만큼 생긴다.
+# 모든 노드가 이 인스턴스를 import해서 같은 커넥션을 재사용한다.
+GEMINI = ChatGoogleGenerativeAI(model=GEMINI_MODEL_ID, temperature=0)
+
+
+async def warmup_gemini() -> None:
+    """Gemini 클라이언트를 미리 호출해 첫 요청의 지연을 없앤다.
+
+    인증 정보 로드와 커넥션 생성은 첫 호출 때 일어나므로,
+    앱 기동 시 짧은 요청을 한 번 보내 그 비용을 미리 치른다.
+    실패해도 서비스 기동을 막지 않도록 경고 로그만 남긴다.
+    """
+    try:
+        await GEMINI.ainvoke([HumanMessage(content="ping")])
+    except Exception as exc:
+        logger.warning("Gemini warmup failed: %s", exc)
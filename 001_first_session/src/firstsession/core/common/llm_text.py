@@ -0,0 +1,66 @@
+# 목적: LLM 응답에서 텍스트를 꺼내는 공용 함수를 제공한다.
+# 설명: AIMessage.content가 문자열/블록 리스트/dict 중 무엇이든 하나의 문자열로 만들고, 번역 출력을 정리한다.
+# 디자인 패턴: 유틸리티 함수
+# 참조: firstsession/core/translate/nodes/translate_node.py, firstsession/core/translate/nodes/qc_and_fix_node.py
+
+"""LLM 응답 텍스트 추출/정리 모듈."""
+
+from typing import Any
+
+
+def extract_text(resp: Any) -> str:
+    """LLM 응답의 텍스트를 앞뒤 공백 없이 반환한다.
+
+    대부분의 응답은 content가 문자열이므로 그 경우를 가장 먼저 확인한다.
+    (type(...) is str 비교는 isinstance보다 싸다)
+
+    Args:
+        resp: LangChain 응답(보통 AIMessage) 또는 content 값.
+
+    Returns:
+        str: 추출한 텍스트.
+    """
+    # langchain 응답은 보통 AIMessage
+    content = getattr(resp, "content", resp)
+
+    # 1) 이미 문자열이면 끝
+    if type(content) is str:
+        return content.strip()
+
+    # 2) list[dict] 형태(Gemini 구조화 content)
+    if isinstance(content, list):
+        parts = []
+        for item in content:
+            if isinstance(item, dict):
+                if item.get("type") == "text" and isinstance(item.get("text"), str):
+                    parts.append(item["text"])
+            elif isinstance(item, str):
+                parts.append(item)
+        return "\n".join(parts).strip()
+
+    # 3) dict면 text 키 우선
+    if isinstance(content, dict) and isinstance(content.get("text"), str):
+        return content["text"].strip()
+
+    # 4) fallback (str 하위 타입 포함)
+    return str(content).strip()
+
+
+def clean_translation(text: str) -> str:
+    """번역 출력에서 코드펜스와 감싸는 따옴표를 제거한다.
+
+    코드펜스는 드물게만 붙으므로 포함 여부를 먼저 확인해
+    대부분의 응답에서 replace 복사를 생략한다.
+
+    Args:
+        text: LLM이 생성한 번역 텍스트.
+
+    Returns:
+        str: 정리된 번역 텍스트.
+    """
+    if "```" in text:
+        text = text.replace("```", "")
+    text = text.strip()
+    if len(text) >= 2 and text[0] == text[-1] and text[0] in "\"'":
+        return text[1:-1].strip()
+    return text
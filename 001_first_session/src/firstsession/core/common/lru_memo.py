@@ -0,0 +1,68 @@
+# 목적: 노드 내부에서 LLM 판정 결과를 재사용하는 작은 LRU 저장소를 제공한다.
+# 설명: 텍스트 해시를 키로, 정상 응답으로 얻은 값만 저장하고 최대 항목 수를 넘으면 오래된 것부터 버린다.
+# 디자인 패턴: LRU 캐시
+# 참조: firstsession/core/translate/nodes/normalize_input_node.py, firstsession/core/translate/nodes/safeguard_classify_node.py
+
+"""LLM 판정 결과 LRU 모듈."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Generic, Optional, TypeVar
+
+V = TypeVar("V")
+
+
+class LRUMemo(Generic[V]):
+    """텍스트 해시 → 값 LRU 저장소.
+
+    LangGraph 노드 캐시는 노드가 반환한 값을 그대로 저장하므로,
+    LLM 호출 실패 후의 대체값(fallback)까지 다른 요청에 재사용된다.
+    노드가 이 저장소에 정상 응답만 직접 넣으면 실패는 그 요청에서 끝난다.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """저장소를 초기화한다.
+
+        Args:
+            maxsize: 보관할 최대 항목 수.
+        """
+        self._maxsize = maxsize
+        self._data: OrderedDict[bytes, V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(*parts: Optional[str]) -> bytes:
+        """입력 문자열들로 고정 길이 키를 만든다.
+
+        긴 원문(최대 10k자)을 키로 그대로 들고 있지 않도록 해시만 저장한다.
+
+        Args:
+            *parts: 키를 구성하는 문자열(None 허용).
+
+        Returns:
+            bytes: 16바이트 blake2b 다이제스트.
+        """
+        h = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            h.update((part or "").encode())
+            h.update(b"\0")
+        return h.digest()
+
+    def get(self, key: bytes) -> Optional[V]:
+        """값을 조회하고, 적중하면 최근 사용으로 옮긴다."""
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: bytes, value: V) -> None:
+        """값을 저장하고, 상한을 넘으면 가장 오래 쓰이지 않은 항목을 버린다."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
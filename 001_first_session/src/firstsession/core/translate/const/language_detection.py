@@ -0,0 +1,14 @@
+# 목적: 언어 감지 LLM의 구조화 출력 스키마를 정의한다.
+# 설명: Gemini JSON 응답 스키마로 사용해 코드펜스/문자열 파싱 없이 결과를 받는다.
+# 디자인 패턴: DTO
+# 참조: firstsession/core/translate/nodes/normalize_input_node.py, docs/04_string_tricks/04_json_안전_파싱.md
+
+"""언어 감지 결과 스키마 모듈."""
+
+from pydantic import BaseModel, Field
+
+
+class LanguageDetection(BaseModel):
+    """언어 감지 결과."""
+
+    language: str = Field(..., description="BCP-47 언어 코드(예: ko, en, ja, zh-Hans)")
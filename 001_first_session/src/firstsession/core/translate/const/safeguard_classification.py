@@ -0,0 +1,18 @@
+# 목적: 안전 분류 LLM의 구조화 출력 스키마를 정의한다.
+# 설명: Gemini 응답 스키마(enum)로 사용해 네 가지 라벨 외의 출력이 생성되지 않게 한다.
+# 디자인 패턴: DTO
+# 참조: firstsession/core/translate/nodes/safeguard_classify_node.py, docs/04_string_tricks/02_single_choice_파서.md
+
+"""안전 분류 결과 스키마 모듈."""
+
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+SafeguardLabel = Literal["PASS", "PII", "HARMFUL", "PROMPT_INJECTION"]
+
+
+class SafeguardClassification(BaseModel):
+    """안전 분류 결과."""
+
+    label: SafeguardLabel = Field(..., description="안전 분류 라벨(PASS/PII/HARMFUL/PROMPT_INJECTION)")
@@ -1,33 +1,53 @@
 # 목적: 번역 처리를 LangGraph로 구성한다.
-# 설명: 입력 → 안전 분류 → 번역 → QC → 재번역 → 응답 흐름을 연결한다.
+# 설명: 입력 → 룰 선판정 → (LLM 안전 분류 ∥ 번역) → 안전 결정 → QC/교정 → 응답 흐름을 연결한다.
 # 디자인 패턴: 파이프라인 + 빌더
 # 참조: docs/04_string_tricks/01_yes_no_파서.md, docs/04_string_tricks/02_single_choice_파서.md
 
 """번역 그래프 구성 모듈."""
 
+import functools
+import json
+
 from langgraph.graph import START, END, StateGraph
+from langgraph.types import CachePolicy
 
+from firstsession.core.common.bounded_cache import BoundedInMemoryCache
 from firstsession.core.translate.state.translation_state import TranslationState
 from firstsession.core.translate.nodes.normalize_input_node import NormalizeInputNode
 from firstsession.core.translate.nodes.safeguard_classify_node import SafeguardClassifyNode
 from firstsession.core.translate.nodes.safeguard_decision_node import SafeguardDecisionNode
 from firstsession.core.translate.nodes.safeguard_fail_response_node import SafeguardFailResponseNode
 from firstsession.core.translate.nodes.translate_node import TranslateNode
-from firstsession.core.translate.nodes.quality_check_node import QualityCheckNode
-from firstsession.core.translate.nodes.retry_gate_node import RetryGateNode
-from firstsession.core.translate.nodes.retry_translate_node import RetryTranslateNode
+from firstsession.core.translate.nodes.qc_and_fix_node import QCAndFixNode
 from firstsession.core.translate.nodes.response_node import ResponseNode
 
 class TranslateGraph:
     """번역 그래프 실행기."""
 
+    # LLM 노드 캐시 유지 시간(초)
+    _CACHE_TTL_SECONDS = 600
+    # 노드 하나가 캐시에 보관할 최대 항목 수(LRU)
+    # (번역 결과는 최대 10k자이므로 항목 수로 메모리 상한을 정한다)
+    _CACHE_MAX_ENTRIES = 1024
+
+    # 배치 실행 시 동시에 돌릴 최대 그래프 수
+    # (큰 배치가 한꺼번에 Gemini 호출을 쏟아내 rate limit에 걸리지 않게 한다)
+    _BATCH_MAX_CONCURRENCY = 8
+
     def __init__(self) -> None:
         """그래프를 초기화한다."""
         graph = self._build_graph()
-        self._app = graph.compile()
+        # 노드 캐시 저장소: cache_policy가 지정된 노드의 결과를 재사용한다.
+        # (기본 InMemoryCache는 크기 제한이 없어 장기 실행 서버에서 메모리가 계속 늘어난다)
+        self._app = graph.compile(
+            cache=BoundedInMemoryCache(maxsize=self._CACHE_MAX_ENTRIES)
+        )
+
+    async def run(self, state: TranslationState) -> TranslationState:
+        """번역 그래프를 비동기로 실행한다.
 
-    def run(self, state: TranslationState) -> TranslationState:
-        """번역 그래프를 실행한다.
+        LLM 호출 노드가 모두 async이므로 ainvoke로 실행해야
+        Gemini 응답을 기다리는 동안 다른 요청을 처리할 수 있다.
 
         Args:
             state: 번역 입력 상태.
@@ -35,9 +55,41 @@ class TranslateGraph:
         Returns:
             TranslationState: 번역 결과 상태.
         """
-        return self._app.invoke(state)
+        return await self._app.ainvoke(state)
         raise NotImplementedError("번역 그래프 실행 로직을 구현해야 합니다.")
 
+    async def run_many(self, states: list[TranslationState]) -> list[TranslationState]:
+        """여러 상태를 한 번에 비동기로 실행한다.
+
+        LangGraph abatch로 실행해 요청들의 LLM 호출이 겹치도록 하고,
+        동시 실행 수는 _BATCH_MAX_CONCURRENCY로 제한한다.
+
+        Args:
+            states: 번역 입력 상태 목록.
+
+        Returns:
+            list[TranslationState]: 입력 순서와 동일한 결과 상태 목록.
+        """
+        return await self._app.abatch(
+            states, config={"max_concurrency": self._BATCH_MAX_CONCURRENCY}
+        )
+
+    async def warmup(self) -> None:
+        """빈 입력으로 그래프를 한 번 실행해 첫 요청의 초기화 비용을 없앤다.
+
+        빈 텍스트는 모든 노드가 LLM 호출 없이 통과하므로,
+        외부 호출 없이 실행 경로(노드/라우팅/캐시)만 미리 데운다.
+        """
+        await self.run(
+            {
+                "source_language": "en",
+                "target_language": "en",
+                "text": "",
+                "retry_count": 0,
+                "max_retry_count": 1,
+            }
+        )
+
     def _build_graph(self) -> StateGraph:
         """번역 그래프를 구성한다.
 
@@ -52,49 +104,93 @@ class TranslateGraph:
         safeguard_decision = SafeguardDecisionNode()
         safeguard_fail = SafeguardFailResponseNode()
         translate = TranslateNode()
-        quality_check = QualityCheckNode()
-        retry_gate = RetryGateNode()
-        retry_translate = RetryTranslateNode()
+        qc_and_fix = QCAndFixNode()
         response = ResponseNode()
 
+        # --- LLM 노드 캐시 키 ---
+        # 노드 출력에 영향을 주는 입력 필드만 키로 사용한다.
+        # (같은 문장을 여러 사용자가 번역하거나 재요청할 때 LLM 호출을 생략)
+        # 주의: 캐시 적중 시 조건부 엣지의 분기 결과도 함께 재사용되므로,
+        #       분기 판단에 쓰이는 필드(retry_count 등)도 키에 포함해야 한다.
+        def _cache_key(*keys: str):
+            def key_func(state: TranslationState) -> str:
+                return json.dumps([state.get(k) for k in keys], ensure_ascii=False)
+
+            return key_func
+
+        def _cache_policy(*keys: str) -> CachePolicy:
+            return CachePolicy(key_func=_cache_key(*keys), ttl=self._CACHE_TTL_SECONDS)
+
+        # 정규화 노드는 캐시하지 않는다.
+        # (LLM 언어 감지가 실패하면 source_language=None으로 끝나므로, 노드 캐시에 두면
+        #  일시 오류 결과가 TTL 동안 같은 문장의 모든 요청에 재사용된다.
+        #  정상 감지 결과만 NormalizeInputNode가 직접 저장해 재사용한다)
         graph.add_node("normalize", normalize.run)
+        # 안전 분류 노드는 캐시하지 않는다.
+        # (분류 응답 파싱에 실패하면 룰 판정/PASS로 대체되므로, 노드 캐시에 두면
+        #  모델이 내리지 않은 판정이 TTL 동안 같은 문장의 모든 요청에 재사용된다.
+        #  모델이 실제로 돌려준 라벨만 SafeguardClassifyNode가 직접 저장해 재사용한다)
         graph.add_node("safeguard_classify", safeguard_classify.run)
+        # 룰 선판정은 정규식 한 번뿐이라 캐시하지 않는다.
+        # (캐시 적중 시 분기 결과가 재사용되므로, 분기 노드는 항상 직접 실행한다)
+        graph.add_node("safeguard_rules", safeguard_classify.run_rules)
         graph.add_node("safeguard_decision", safeguard_decision.run)
         graph.add_node("safeguard_fail", safeguard_fail.run)
-        graph.add_node("translate", translate.run)
-        graph.add_node("quality_check", quality_check.run)
-        graph.add_node("retry_gate", retry_gate.run)
-        graph.add_node("retry_translate", retry_translate.run)
+        graph.add_node(
+            "translate",
+            translate.run,
+            cache_policy=_cache_policy("text", "source_language", "target_language"),
+        )
+        graph.add_node(
+            "qc_and_fix",
+            qc_and_fix.run,
+            cache_policy=_cache_policy(
+                "text",
+                "translated_text",
+                "source_language",
+                "target_language",
+                "retry_count",
+                "max_retry_count",
+            ),
+        )
         graph.add_node("response", response.run)
 
+        # 룰(PII/인젝션/유해)에 걸린 입력은 번역 없이 바로 차단 경로로 보낸다.
+        # - 원문(이메일/전화번호 등)이 번역용 Gemini 호출로 전송되지 않는다.
+        # 룰을 통과한 입력만 LLM 안전 분류와 번역을 병렬로 실행한다(fork).
+        # - 두 노드가 같은 superstep에서 돌고, Gemini 왕복 한 번만큼 지연이 줄어든다.
+        # - safeguard_decision은 두 노드가 모두 끝난 뒤 실행된다(join).
+        # - LLM 분류로 차단된 경우 번역 결과는 ResponseNode가 error_message로 덮어써 버려진다.
         graph.add_edge(START, "normalize")
-        graph.add_edge("normalize", "safeguard_classify")
-        graph.add_edge("safeguard_classify", "safeguard_decision")
+        graph.add_edge("normalize", "safeguard_rules")
+        graph.add_edge(["safeguard_classify", "translate"], "safeguard_decision")
+
+        def route_after_rules(state: TranslationState) -> str | list[str]:
+            if state.get("safeguard_label"):
+                return "safeguard_decision"
+            return ["safeguard_classify", "translate"]
 
-        def _get(state, key, default=None):
-            if isinstance(state, dict):
-                return state.get(key, default)
-            return getattr(state, key, default)
+        graph.add_conditional_edges(
+            "safeguard_rules",
+            route_after_rules,
+            ["safeguard_decision", "safeguard_classify", "translate"],
+        )
 
         def route_after_safeguard(state: TranslationState) -> str:
-            label = (_get(state, "safeguard_label") or "PASS").strip()
-            return "translate" if label == "PASS" else "safeguard_fail"
+            label = state.get("safeguard_label") or "PASS"
+            return "qc_and_fix" if label == "PASS" else "safeguard_fail"
 
-        def route_after_retry_gate(state: TranslationState) -> str:
-            qc = (_get(state, "qc_passed") or "NO").strip().upper()
+        def route_after_qc_and_fix(state: TranslationState) -> str:
+            qc = state.get("qc_passed") or "NO"
 
             if qc == "YES":
                 return "response"
 
-            retry_count = int(_get(state, "retry_count", 0) or 0)
-            max_retry_count = int(_get(state, "max_retry_count", 0) or 0)
-
-            # 기본값 방어(0이면 RetryGateNode에서 1로 넣지만, 라우팅 함수도 안전하게)
-            if max_retry_count <= 0:
-                max_retry_count = 1
-
-            if retry_count < max_retry_count:
-                return "retry_translate"
+            # QC 실패 시 qc_and_fix가 이미 교정본을 기록했으므로,
+            # 재시도가 남아 있으면 교정본을 다시 검사한다.
+            # (재시도 필드는 TranslationService가 int로 채워 넣으므로 보정 없이 비교한다)
+            if state["retry_count"] < state["max_retry_count"]:
+                return "qc_and_fix"
             return "response"
 
 
@@ -102,7 +198,7 @@ class TranslateGraph:
             "safeguard_decision",
             route_after_safeguard,
             {
-                "translate": "translate",
+                "qc_and_fix": "qc_and_fix",
                 "safeguard_fail": "safeguard_fail",
             },
         )
@@ -110,20 +206,15 @@ class TranslateGraph:
         graph.add_edge("safeguard_fail", "response")
         graph.add_edge("response", END)
 
-        graph.add_edge("translate", "quality_check")
-        graph.add_edge("quality_check", "retry_gate")
-
         graph.add_conditional_edges(
-            "retry_gate",
-            route_after_retry_gate,
+            "qc_and_fix",
+            route_after_qc_and_fix,
             {
-                "retry_translate": "retry_translate",
+                "qc_and_fix": "qc_and_fix",
                 "response": "response",
             },
         )
 
-        graph.add_edge("retry_translate", "quality_check")
-
         return graph
 
 
@@ -140,22 +231,34 @@ class TranslateGraph:
         # - SafeguardDecisionNode: PASS 여부 기록 및 오류 메시지 세팅
         # - SafeguardFailResponseNode: 차단 응답 구성
         # - TranslateNode: 번역 수행
-        # - QualityCheckNode: 번역 품질 YES/NO 판정
-        # - RetryGateNode: 재번역 가능 여부 판단
-        # - RetryTranslateNode: 재번역 수행
+        # - QCAndFixNode: 번역 품질 YES/NO 판정 및 실패 시 교정
         # - ResponseNode: 최종 응답 구성
 
         # TODO: 조건부 엣지 설계(구체 경로 예시)
-        # - NormalizeInputNode -> SafeguardClassifyNode -> SafeguardDecisionNode
+        # - NormalizeInputNode -> 룰 선판정 -> (SafeguardClassifyNode ∥ TranslateNode) -> SafeguardDecisionNode
+        #   - 룰에 걸리면 번역 없이 바로 SafeguardDecisionNode
         # - SafeguardDecisionNode에서 PASS가 아니면 SafeguardFailResponseNode -> ResponseNode -> END
         #   - safeguard_label: PASS/PII/HARMFUL/PROMPT_INJECTION (안전 분류 결과)
         #   - error_message: 차단 시 사용자에게 전달할 메시지
-        # - PASS면 TranslateNode -> QualityCheckNode -> RetryGateNode
-        # - RetryGateNode에서 qc_passed가 YES이면 ResponseNode -> END
+        # - PASS면 (이미 끝난 TranslateNode 결과로) QCAndFixNode
+        # - QCAndFixNode 이후 qc_passed가 YES이면 ResponseNode -> END
         #   - qc_passed: YES/NO (번역 품질 검사 결과)
-        # - RetryGateNode에서 qc_passed가 NO이고 재시도 가능하면 RetryTranslateNode -> QualityCheckNode로 루프
+        # - QCAndFixNode 이후 qc_passed가 NO이고 재시도 가능하면 QCAndFixNode로 루프(교정본 재검사)
         #   - retry_count: 재시도 횟수
         #   - max_retry_count: 최대 재시도 횟수
-        # - RetryGateNode에서 qc_passed가 NO이고 재시도 불가이면 ResponseNode -> END
+        # - QCAndFixNode 이후 qc_passed가 NO이고 재시도 불가이면 ResponseNode -> END
         
         raise NotImplementedError("번역 그래프 구성 로직을 구현해야 합니다.")
+
+
+@functools.lru_cache(maxsize=1)
+def get_translate_graph() -> TranslateGraph:
+    """프로세스 전체에서 공유하는 번역 그래프를 반환한다.
+
+    그래프 구성과 compile(엣지/분기 검증)은 한 번만 수행하고,
+    노드 캐시(BoundedInMemoryCache)도 모든 요청이 함께 쓰도록 한다.
+
+    Returns:
+        TranslateGraph: 컴파일된 번역 그래프 실행기.
+    """
+    return TranslateGraph()
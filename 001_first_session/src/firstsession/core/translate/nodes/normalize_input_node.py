@@ -2,20 +2,40 @@
 
 from __future__ import annotations
 
-import json
+import logging
 import re
-from typing import Optional
+from typing import Any, Optional
 
-from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.messages import HumanMessage
 
+from firstsession.core.common.llm_client import GEMINI
+from firstsession.core.common.lru_memo import LRUMemo
+from firstsession.core.translate.const.language_detection import LanguageDetection
 from firstsession.core.translate.state.translation_state import TranslationState
 
+logger = logging.getLogger(__name__)
+
+# 언어 감지는 JSON 스키마(구조화 출력)로 받는다.
+# (Gemini가 스키마에 맞는 JSON만 생성하므로 코드펜스 제거/json.loads 파싱이 필요 없다)
+_LANG_DETECTOR = GEMINI.with_structured_output(LanguageDetection)
+
+# LLM 언어 감지 결과 재사용(같은 문장을 여러 사용자가 번역할 때 감지 호출 생략)
+# - 노드 캐시 대신 정상 감지 결과만 저장한다.
+#   (감지 실패로 source_language=None이 된 결과가 다른 요청에 재사용되지 않게)
+_DETECT_MEMO: LRUMemo[str] = LRUMemo(maxsize=4096)
+
+# 언어 코드(BCP-47 단순형: ko, en, zh-Hans 등) 검증용 정규식
+_RE_BCP47 = re.compile(r"[a-z]{2,3}(?:-[A-Za-z]{2,8})?")
+
+# 탭 → 공백 변환 테이블 (str.translate는 C 수준 루프로 처리된다)
+_TAB_TO_SPACE = str.maketrans("\t", " ")
+# 3줄 이상 연속 개행은 드물게만 나오므로 정규식은 이 경우에만 쓴다.
+_RE_MULTI_NEWLINE = re.compile(r"\n{3,}")
+
 
 class NormalizeInputNode:
     """입력 정규화를 담당하는 노드."""
 
-    _MODEL_ID = "gemini-3-flash-preview"
     _MAX_TEXT_CHARS = 10_000
 
     _LANG_ALIAS = {
@@ -29,65 +49,60 @@ class NormalizeInputNode:
         "zh-tw": "zh-Hant",
     }
 
-    _RE_MULTI_SPACE = re.compile(r"[ \t]+")
-    _RE_MULTI_NEWLINE = re.compile(r"\n{3,}")
+    # 문자 체계(스크립트) 기반 빠른 언어 감지 설정
+    # - 앞부분 일부 문자만 보고, 한 스크립트가 충분히 우세할 때만 확정한다.
+    _FAST_DETECT_SCAN_CHARS = 512
+    _FAST_DETECT_MIN_RATIO = 0.7
+    # LLM 언어 감지에는 앞부분만 보낸다(감지에 전체 본문은 필요 없다).
+    _DETECT_PROMPT_CHARS = 1000
 
-    def __init__(self) -> None:
-        self._llm = ChatGoogleGenerativeAI(
-            model=self._MODEL_ID,
-            temperature=0,
-        )
-
-    def run(self, state: TranslationState) -> TranslationState:
-        print("[NODE] NormalizeInputNode")
-        print("[DBG] service_state_id:", id(state))
+    async def run(self, state: TranslationState) -> dict[str, Any]:
+        logger.debug("[NODE] NormalizeInputNode state_id=%s", id(state))
 
         # ✅ dict 기반으로 읽기 (LangGraph가 dict로 넘기는 케이스 대응)
-        text = self._get(state, "text", default="") or ""
-        src = self._get(state, "source_language")
-        tgt = self._get(state, "target_language")
+        text = state.get("text", "") or ""
+        src = state.get("source_language")
+        tgt = state.get("target_language")
+        updates: dict[str, Any] = {}
 
         # 1) 공백 정리
-        text = text.strip()
-        text = self._RE_MULTI_SPACE.sub(" ", text)
-        text = self._RE_MULTI_NEWLINE.sub("\n\n", text)
+        # - 탭을 공백으로 바꾼 뒤 연속 공백을 str.replace로 접는다.
+        #   (반복마다 공백 run 길이가 절반으로 줄어 몇 번 안에 끝난다)
+        text = text.strip().translate(_TAB_TO_SPACE)
+        while "  " in text:
+            text = text.replace("  ", " ")
+        if "\n\n\n" in text:
+            text = _RE_MULTI_NEWLINE.sub("\n\n", text)
 
         # 2) 길이 제한
         if len(text) > self._MAX_TEXT_CHARS:
             text = text[: self._MAX_TEXT_CHARS]
-            self._set(state, "warning_message", "Input text truncated by max length rule.")
+            updates["warning_message"] = "Input text truncated by max length rule."
 
         # 3) 언어 코드 정규화
         src = self._normalize_lang_code(src)
         tgt = self._normalize_lang_code(tgt)
 
-        # 4) source_language 없으면 Gemini로 감지
+        # 4) source_language 없으면 감지
+        # - 문자 체계가 한 언어에만 쓰이는 경우(한글 → ko, 가나 → ja)는 LLM 호출을 생략한다.
+        # - 라틴/키릴 문자/한자만 있는 텍스트는 언어를 특정할 수 없어 Gemini로 감지한다.
+        # - 애매한 경우에만 Gemini로 감지한다.
         if not src and text:
-            detected = self._detect_language(text)
+            detected = self._fast_detect(text) or await self._detect_language(text)
             if detected:
                 src = detected
 
-        # 5) state 반영 (✅ dict에 쓰기)
-        self._set(state, "text", text)
-        self._set(state, "source_language", src)
-        self._set(state, "target_language", tgt)
+        # 5) 변경한 필드만 반환한다.
+        updates["text"] = text
+        updates["source_language"] = src
+        updates["target_language"] = tgt
 
-        return state
+        return updates
 
     # -------------------------
     # Helpers
     # -------------------------
 
-    def _get(self, state: Any, key: str, default: Any = None) -> Any:
-        if isinstance(state, dict):
-            return state.get(key, default)
-        return getattr(state, key, default)
-
-    def _set(self, state: Any, key: str, value: Any) -> None:
-        if isinstance(state, dict):
-            state[key] = value
-        else:
-            setattr(state, key, value)
 
     def _normalize_lang_code(self, lang: Optional[str]) -> Optional[str]:
         if not lang:
@@ -96,33 +111,76 @@ class NormalizeInputNode:
         lang = lang.strip().lower()
         lang = self._LANG_ALIAS.get(lang, lang)
 
-        if not re.fullmatch(r"[a-z]{2,3}(?:-[A-Za-z]{2,8})?", lang):
+        if not _RE_BCP47.fullmatch(lang):
             return None
 
         return lang
 
-    def _detect_language(self, text: str) -> Optional[str]:
+    def _fast_detect(self, text: str) -> Optional[str]:
+        """문자 체계 분포로 언어를 빠르게 추정한다.
+
+        Args:
+            text: 정규화된 입력 텍스트.
+
+        Returns:
+            Optional[str]: 우세한 스크립트의 언어 코드. 애매하면 None.
+        """
+        counts = {"ko": 0, "ja": 0}
+        total = 0
+        # 한자는 중국어(간체/번체)와 일본어 모두에 쓰이므로 단독으로는 언어를 확정하지 않는다.
+        han = 0
+
+        for ch in text[: self._FAST_DETECT_SCAN_CHARS]:
+            if not ch.isalpha():
+                continue
+            total += 1
+            cp = ord(ch)
+            if 0xAC00 <= cp <= 0xD7A3 or 0x1100 <= cp <= 0x11FF or 0x3130 <= cp <= 0x318F:
+                counts["ko"] += 1
+            elif 0x3040 <= cp <= 0x30FF:
+                counts["ja"] += 1
+            elif 0x4E00 <= cp <= 0x9FFF:
+                han += 1
+            # 라틴 문자(영어/스페인어/독일어 등)와 키릴 문자(러시아어/우크라이나어/
+            # 불가리아어 등)는 여러 언어가 함께 쓰므로 어느 언어에도 세지 않는다.
+            # (분모에만 포함되어, 이 문자들이 우세하면 LLM 감지로 넘어간다)
+
+        if not total:
+            return None
+
+        # 일본어는 가나와 한자를 섞어 쓰므로, 가나가 있으면 한자도 일본어로 합산한다.
+        if counts["ja"]:
+            counts["ja"] += han
+
+        lang, count = max(counts.items(), key=lambda item: item[1])
+        if count / total >= self._FAST_DETECT_MIN_RATIO:
+            return lang
+        return None
+
+    async def _detect_language(self, text: str) -> Optional[str]:
+        head = text[: self._DETECT_PROMPT_CHARS]
+        key = LRUMemo.key(head)
+        cached = _DETECT_MEMO.get(key)
+        if cached is not None:
+            return cached
+
         prompt = (
             "Detect the language of the following text.\n"
-            "Return ONLY valid JSON like:\n"
-            '{"language": "ko"}\n\n'
-            f"Text:\n{text}"
+            "Answer with its BCP-47 language code (e.g. ko, en, ja, zh-Hans).\n\n"
+            f"Text:\n{head}"
         )
 
         try:
-            response = self._llm.invoke(
+            result = await _LANG_DETECTOR.ainvoke(
                 [HumanMessage(content=prompt)]
             )
-
-            content = response.content.strip()
-
-            # LLM이 가끔 ```json 블록 감싸는 경우 대비
-            content = content.replace("```json", "").replace("```", "").strip()
-
-            data = json.loads(content)
-            lang = data.get("language")
-
-            return self._normalize_lang_code(lang)
-
         except Exception:
+            # 네트워크/스키마 오류 시 감지 실패로 처리한다(이 요청만 auto로 번역, 저장하지 않음).
             return None
+
+        if result is None:
+            return None
+        lang = self._normalize_lang_code(result.language)
+        if lang:
+            _DETECT_MEMO.put(key, lang)
+        return lang
@@ -0,0 +1,154 @@
+"""번역 품질 검사 + 교정 노드 모듈."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Literal
+
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from firstsession.core.common.llm_client import GEMINI
+from firstsession.core.common.llm_text import clean_translation, extract_text
+from firstsession.core.translate.state.translation_state import TranslationState
+
+logger = logging.getLogger(__name__)
+
+# QC 판정 + 교정 규칙(정적 시스템 프롬프트)
+# - 원문/번역문/언어처럼 요청마다 바뀌는 값은 사용자 메시지로만 보낸다.
+# - 앞부분이 항상 같아 Gemini 접두어(implicit) 캐시 적중 대상이 된다.
+_QC_AND_FIX_SYSTEM_PROMPT = """
+You are a translation quality gate and senior professional translator for a production system.
+
+Task:
+Given SOURCE and TRANSLATION, decide if the translation is acceptable.
+If it is not, fix it.
+
+Output format (very important):
+- If the translation is acceptable, output exactly: YES
+- Otherwise output NO on the first line, then the corrected translation from the next line.
+
+Criteria (fail with NO if any are true):
+- Translation meaning is significantly wrong or missing key info.
+- Adds harmful/extra content not present in source.
+- Not in the requested target language (shown next to TRANSLATION).
+- Garbage output, placeholders, empty, or clearly incomplete.
+- Format is severely broken (minor differences OK).
+
+Notes:
+- Minor paraphrasing is OK if meaning is preserved.
+- Keep it strict: if unsure, answer NO.
+- A long TRANSLATION may show only its beginning and end around a "...[TRUNCATED]..." marker.
+  The omitted middle is not missing content; judge the visible parts.
+
+Corrected translation rules:
+- Output ONLY the corrected translation text after the NO line.
+- No explanations, no bullet points, no quotes, no code fences.
+- Must be in the target language.
+- Preserve ALL meaning; do not omit details.
+- Do not add information that is not in the source.
+- Preserve formatting (line breaks, lists) as much as possible.
+""".strip()
+# 시스템 메시지는 요청마다 같으므로 한 번만 만든다.
+_QC_AND_FIX_SYSTEM_MESSAGE = SystemMessage(content=_QC_AND_FIX_SYSTEM_PROMPT)
+
+YesNo = Literal["YES", "NO"]
+
+
+class QCAndFixNode:
+    """번역 품질 검사와 교정을 한 번의 LLM 호출로 수행하는 노드.
+
+    QC 판정(YES/NO)과 실패 시 재번역을 같은 응답으로 받아,
+    재시도 경로의 Gemini 왕복을 두 번에서 한 번으로 줄인다.
+    """
+
+    # 모델이 붙이는 흔한 접두어("Answer: YES", "Label: NO")
+    _ANSWER_PREFIXES = ("ANSWER:", "LABEL:")
+
+    # 프롬프트에 넣을 기존 번역문 길이 제한
+    # - 품질 판정은 앞/뒤 일부만 봐도 충분하므로 긴 번역문은 잘라 입력 토큰을 줄인다.
+    # - 원문은 교정 번역의 입력이므로 자르지 않는다.
+    _CLIP_MAX_CHARS = 3000
+    _CLIP_EDGE_CHARS = 1500
+
+    async def run(self, state: TranslationState) -> dict[str, Any]:
+        logger.debug("[NODE] QCAndFixNode state_id=%s", id(state))
+
+        src_text = state.get("text", "") or ""
+        tgt_text = state.get("translated_text", "") or ""
+        src_lang = state.get("source_language") or "auto"
+        tgt_lang = state.get("target_language") or "en"
+
+        # 입력이 비어있으면 통과로 간주(정책에 맞게 변경 가능)
+        if not src_text or src_text.isspace():
+            return {"qc_passed": "YES", "qc_reason": None}
+
+        raw = await self._judge_and_fix(
+            source_text=src_text,
+            translated_text=tgt_text,
+            source_language=src_lang,
+            target_language=tgt_lang,
+        )
+
+        # 첫 줄은 판정, 나머지는 교정된 번역
+        # (응답 전체가 코드펜스로 감싸이면 펜스 줄이 첫 줄이 되므로 먼저 펜스와 앞 공백 줄을 지운다)
+        if "```" in raw:
+            raw = raw.replace("```", "").strip()
+        head, _, rest = raw.partition("\n")
+        yn = self._normalize_yes_no(head, fallback="NO")
+        logger.debug("QCAndFixNode qc_passed=%s", yn)
+
+        if yn == "YES":
+            return {"qc_passed": "YES", "qc_reason": None}
+
+        # retry_count 갱신 (루프 안전장치)
+        # - 교정문이 비어 있어도 횟수는 늘려야 루프가 끝난다.
+        retry_count = state["retry_count"] + 1
+        updates: dict[str, Any] = {
+            "qc_passed": "NO",
+            "qc_reason": "empty_translation" if not tgt_text or tgt_text.isspace() else "qc_failed",
+            "retry_count": retry_count,
+        }
+
+        fixed = clean_translation(rest)
+        if fixed:
+            updates["translated_text"] = fixed
+            updates["last_translation"] = fixed
+
+        logger.debug("QCAndFixNode retry_count=%s", retry_count)
+        return updates
+
+    async def _judge_and_fix(
+        self,
+        source_text: str,
+        translated_text: str,
+        source_language: str,
+        target_language: str,
+    ) -> str:
+        prompt = (
+            f"SOURCE ({source_language}):\n{source_text}\n\n"
+            f"TRANSLATION ({target_language}):\n{self._clip(translated_text)}"
+        )
+
+        resp = await GEMINI.ainvoke(
+            [_QC_AND_FIX_SYSTEM_MESSAGE, HumanMessage(content=prompt)]
+        )
+        return extract_text(resp)
+
+    def _clip(self, s: str) -> str:
+        if len(s) <= self._CLIP_MAX_CHARS:
+            return s
+        edge = self._CLIP_EDGE_CHARS
+        return s[:edge] + "\n...[TRUNCATED]...\n" + s[-edge:]
+
+    def _normalize_yes_no(self, raw: str, fallback: YesNo = "NO") -> YesNo:
+        # 흔한 형태 방어: "YES.", "Answer: YES", 코드블럭 등
+        # (정규식/split 없이 앞부분 접두어만 확인한다)
+        s = (raw or "").strip().strip("`").strip().upper()
+        if s.startswith(self._ANSWER_PREFIXES):
+            s = s.partition(":")[2].lstrip()
+
+        if s.startswith("YES"):
+            return "YES"
+        if s.startswith("NO"):
+            return "NO"
+        return fallback
@@ -2,13 +2,38 @@
 
 from __future__ import annotations
 
+import logging
+
 from typing import Any, Optional
 
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import HumanMessage, SystemMessage
 
+from firstsession.core.common.llm_client import GEMINI
+from firstsession.core.common.llm_text import clean_translation, extract_text
 from firstsession.core.translate.state.translation_state import TranslationState
 
+logger = logging.getLogger(__name__)
+
+# 번역 규칙(정적 시스템 프롬프트)
+# - 요청마다 바뀌는 값(언어/원문)은 사용자 메시지로만 보낸다.
+# - 앞부분이 항상 같아 Gemini 접두어(implicit) 캐시 적중 대상이 된다.
+_TRANSLATE_SYSTEM_PROMPT = """
+You are a strict translation engine.
+
+Translate the text from SOURCE LANGUAGE to TARGET LANGUAGE.
+
+Rules:
+- Output ONLY the translated text.
+- Do NOT add explanations, notes, examples, or extra words.
+- Do NOT add quotes, code fences, or markdown.
+- Preserve meaning, tone, nuance, and formatting (line breaks, punctuation).
+- Keep slang and profanity natural; do not censor or soften.
+- If SOURCE LANGUAGE is "auto", detect the source language automatically.
+- If the input is already in TARGET LANGUAGE, return it unchanged.
+""".strip()
+# 시스템 메시지는 요청마다 같으므로 한 번만 만든다.
+_TRANSLATE_SYSTEM_MESSAGE = SystemMessage(content=_TRANSLATE_SYSTEM_PROMPT)
+
 
 class TranslateNode:
     """번역 수행을 담당하는 노드.
@@ -17,104 +42,40 @@ class TranslateNode:
     - 파이프라인 노드: state를 읽고 state에만 기록
     """
 
-    _MODEL_ID = "gemini-3-flash-preview"
-
-    def __init__(self) -> None:
-        self._llm = ChatGoogleGenerativeAI(model=self._MODEL_ID, temperature=0)
-
-    def run(self, state: TranslationState) -> TranslationState:
-        print("[NODE] TranslateNode")
-        print("[DBG] service_state_id:", id(state))
+    async def run(self, state: TranslationState) -> dict[str, Any]:
+        logger.debug("[NODE] TranslateNode state_id=%s", id(state))
 
-        text = self._get(state, "text", default="") or ""
-        src = self._get(state, "source_language")
-        tgt = self._get(state, "target_language")
+        text = state.get("text", "") or ""
+        src = state.get("source_language")
+        tgt = state.get("target_language")
 
         # 안전장치: 입력 없으면 빈 번역
-        if not text.strip():
-            self._set(state, "translated_text", "")
-            return state
+        if not text or text.isspace():
+            return {"translated_text": ""}
 
         # 언어 코드가 없으면 최소한의 기본값
-        src = (src or "auto").strip()
-        tgt = (tgt or "en").strip()
-
-        translated = self._translate_with_gemini(text=text, source_language=src, target_language=tgt)
-
-        # 상태 기록 규칙
-        self._set(state, "translated_text", translated)
-        self._set(state, "last_translation", translated)  # 재시도 로직에서 쓰기 좋게(있으면)
-        print(state)
-        return state
-
-    def _translate_with_gemini(self, text: str, source_language: str, target_language: str) -> str:
-        prompt = f"""
-You are a strict translation engine.
-
-Translate the text from {source_language} to {target_language}.
-
-Rules:
-- Output ONLY the translated text.
-- Do NOT add explanations, notes, examples, or extra words.
-- Do NOT add quotes, code fences, or markdown.
-- Preserve meaning, tone, nuance, and formatting (line breaks, punctuation).
-- Keep slang and profanity natural; do not censor or soften.
-- If {source_language} is "auto", detect the source language automatically.
-- If the input is already in {target_language}, return it unchanged.
-
-Text:
-{text}
-""".strip()
-        resp = self._llm.invoke([HumanMessage(content=prompt)])
-
-        out = self._extract_text(resp)
-        out = out.replace("```", "").strip()
-        out = self._strip_wrapping_quotes(out)
-        return out
-
-    def _extract_text(self, resp) -> str:
-        # langchain 응답은 보통 AIMessage
-        content = getattr(resp, "content", resp)
-
-        # 1) 이미 문자열이면 끝
-        if isinstance(content, str):
-            return content.strip()
-
-        # 2) list[dict] 형태(지금 네 케이스)
-        if isinstance(content, list):
-            parts = []
-            for item in content:
-                if isinstance(item, dict):
-                    if item.get("type") == "text" and isinstance(item.get("text"), str):
-                        parts.append(item["text"])
-                elif isinstance(item, str):
-                    parts.append(item)
-            return "\n".join(parts).strip()
-
-        # 3) dict면 text 키 우선
-        if isinstance(content, dict) and isinstance(content.get("text"), str):
-            return content["text"].strip()
-
-        # 4) fallback
-        return str(content).strip()
-
-
-    def _strip_wrapping_quotes(self, s: str) -> str:
-        if len(s) >= 2 and ((s[0] == s[-1] == '"') or (s[0] == s[-1] == "'")):
-            return s[1:-1].strip()
-        return s
-
-    # -------------------------
-    # dict/object 공용 get/set
-    # -------------------------
-
-    def _get(self, state: Any, key: str, default: Any = None) -> Any:
-        if isinstance(state, dict):
-            return state.get(key, default)
-        return getattr(state, key, default)
-
-    def _set(self, state: Any, key: str, value: Any) -> None:
-        if isinstance(state, dict):
-            state[key] = value
-        else:
-            setattr(state, key, value)
+        # (NormalizeInputNode가 이미 공백 없는 코드로 정규화했다)
+        src = src or "auto"
+        tgt = tgt or "en"
+
+        translated = await self._translate_with_gemini(text=text, source_language=src, target_language=tgt)
+
+        # 상태 기록 규칙: 변경한 필드만 반환한다(노드 캐시 대상).
+        updates = {
+            "translated_text": translated,
+            "last_translation": translated,  # 재시도 로직에서 쓰기 좋게(있으면)
+        }
+        logger.debug("TranslateNode translated_len=%s", len(translated))
+        return updates
+
+    async def _translate_with_gemini(self, text: str, source_language: str, target_language: str) -> str:
+        prompt = (
+            f"SOURCE LANGUAGE: {source_language}\n"
+            f"TARGET LANGUAGE: {target_language}\n\n"
+            f"Text:\n{text}"
+        )
+        resp = await GEMINI.ainvoke(
+            [_TRANSLATE_SYSTEM_MESSAGE, HumanMessage(content=prompt)]
+        )
+
+        return clean_translation(extract_text(resp))
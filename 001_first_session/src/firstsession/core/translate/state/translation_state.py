@@ -21,3 +21,15 @@ class TranslationState(TypedDict):
     retry_count: int
     max_retry_count: int
     error: str
+    # 노드가 기록하는 보조 필드
+    # (스키마에 선언되지 않은 키는 LangGraph가 다음 노드로 전달하지 않는다)
+    warning_message: str
+    has_sensitive_hint: bool
+    safeguard_passed: bool
+    error_message: str | None
+    qc_reason: str | None
+    last_translation: str
+    status: str
+    success: bool
+    blocked_reason: str
+    audit_log: dict
@@ -5,11 +5,16 @@
 
 """FastAPI 애플리케이션 진입점 모듈."""
 
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+
 from fastapi import FastAPI
 
 from firstsession.api.translate.router.translate_router import TranslateRouter
 from firstsession.api.translate.service.translation_service import TranslationService
-from firstsession.core.translate.graphs.translate_graph import TranslateGraph
+from firstsession.core.common.llm_client import warmup_gemini
+from firstsession.core.translate.graphs.translate_graph import get_translate_graph
 
 
 def create_app() -> FastAPI:
@@ -18,14 +23,26 @@ def create_app() -> FastAPI:
     Returns:
         FastAPI: 구성된 애플리케이션 인스턴스.
     """
-    app = FastAPI(title="firstsession API")
+    # 앱을 여러 번 생성해도(테스트/리로드) 컴파일된 그래프는 프로세스당 하나만 쓴다.
+    graph = get_translate_graph()
+
+    @contextlib.asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        """기동 시 그래프/LLM 클라이언트를 미리 데운다."""
+        # 그래프 실행 경로는 LLM 호출 없이 바로 데우고,
+        # Gemini 호출은 네트워크 대기로 기동이 늦어지지 않도록 백그라운드로 보낸다.
+        await graph.warmup()
+        warmup_task = asyncio.create_task(warmup_gemini())
+        yield
+        warmup_task.cancel()
+
+    app = FastAPI(title="firstsession API", lifespan=lifespan)
 
     @app.get("/health", tags=["health"])
     def health() -> dict[str, str]:
         """간단한 헬스 체크 엔드포인트."""
         return {"status": "ok"}
 
-    graph = TranslateGraph()
     service = TranslationService(graph)
     translate_router = TranslateRouter(service)
     app.include_router(translate_router.router)